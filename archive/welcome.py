@@ -47,24 +47,32 @@ ASCII_LOGO = r"""
           ▓▓▓▓▓▓▓▓▓▓▓█████████          
               ▓▓▓▓▓▓▓▓████              
 """
+ASCII_LOGO_TEXT = Text(ASCII_LOGO, no_wrap=True)
+"""The logo parsed once, shared by all welcome screens."""
 
 
 class KeybindsIntro(Static):
-    def __init__(self) -> None:
-        key_bindings = [
-            "q / Quit current screen",
-            "? / Toggle help panel",
-            "ctrl+o / Open command palette",
-            "ctrl+c / Quit application",
-            "ctrl+z / Suspend process",
-        ]
-        content = [
+    KEY_BINDINGS = (
+        "q / Quit current screen",
+        "? / Toggle help panel",
+        "ctrl+o / Open command palette",
+        "ctrl+c / Quit application",
+        "ctrl+z / Suspend process",
+    )
+    CONTENT = Columns(
+        [
             Text("Key Bindings:", style="italic dim"),
             Columns(
-                key_bindings, align="center", expand=False, equal=True, padding=(0, 3)
+                KEY_BINDINGS, align="center", expand=False, equal=True, padding=(0, 3)
             ),
-        ]
-        super().__init__(Columns(content, align="center", expand=True))
+        ],
+        align="center",
+        expand=True,
+    )
+    """The static renderable, built once and shared by all instances."""
+
+    def __init__(self) -> None:
+        super().__init__(self.CONTENT)
 
 
 class ListOption(Static):
@@ -85,6 +93,7 @@ class ListOption(Static):
         super().__init__(id=id)
         self.option_list = option_list
         self.option_key = main
+        self._tables: dict[bool, Table] = {}
 
         styles = option_list._styles
         self.main = Text(main, style=styles[0])
@@ -94,18 +103,27 @@ class ListOption(Static):
             else description
         )
 
-    def _update_self(self) -> None:
+    def _get_table(self, highlighted: bool) -> Table:
+        """Get the grid for the given highlight state, building it on first use."""
+        try:
+            return self._tables[highlighted]
+        except KeyError:
+            pass
         tab = Table.grid(padding=(0, 2), pad_edge=True)
         tab.add_column("chevron", width=1)
         tab.add_column(width=self.option_list.column_widths[0])
         tab.add_column(width=self.option_list.column_widths[1])
         tab.add_row(
-            Text("❯", style="blue") if self.is_highlighted else " ",
+            Text("❯", style="blue") if highlighted else " ",
             self.main,
             self.description,
-            style=Style(bgcolor="black", bold=True) if self.is_highlighted else None,
+            style=Style(bgcolor="black", bold=True) if highlighted else None,
         )
-        self.update(tab)
+        self._tables[highlighted] = tab
+        return tab
+
+    def _update_self(self) -> None:
+        self.update(self._get_table(self.is_highlighted))
 
     def watch_is_highlighted(self) -> None:
         """Watch the is_highlighted reactive and update the renderable."""
@@ -113,6 +131,7 @@ class ListOption(Static):
 
     def watch_description(self) -> None:
         """Watch the description reactive and update the renderable."""
+        self._tables.clear()
         self._update_self()
 
     @contextmanager
@@ -135,12 +154,12 @@ class ListOption(Static):
         """
         original = getattr(self, attr)
         setattr(self, attr, renderable)
-        timer = self.set_interval(interval, self.refresh)
+        # the spinner advances its own frames on render; just repaint periodically
+        self.auto_refresh = interval
         try:
             yield
         finally:
-            timer.stop()
-            del timer
+            self.auto_refresh = None
             setattr(self, attr, Text.from_markup(success))
             self.set_timer(timeout, lambda: setattr(self, attr, original))
 
@@ -160,13 +179,11 @@ class MenuList(Static, can_focus=True):
         super().__init__()
 
         # compute necessary column widths
-        col_lengths = [len(column) for column in options[0]]
-        for option in options[1:]:
-            for i, column in enumerate(option):
-                col_lengths[i] = max(col_lengths[i], len(column))
-        self.column_widths = col_lengths
+        self.column_widths = tuple(max(map(len, column)) for column in zip(*options))
+        self._content_width = sum(self.column_widths) + 10
 
-        self._styles = styles
+        # parse the column styles once for all options
+        self._styles = tuple(Style.parse(style) for style in styles)
         self._options = options
         self.options = [ListOption(*option, option_list=self) for option in options]
 
@@ -180,22 +197,28 @@ class MenuList(Static, can_focus=True):
         self.update_highlight()
 
     def get_content_width(self, container: Size, viewport: Size) -> int:
-        return sum(self.column_widths) + 10
+        return self._content_width
 
     def update_highlight(self) -> None:
         """Update the highlighting of the options."""
         for i, option in enumerate(self.options):
             option.is_highlighted = i == self.highlighted_index
 
+    def _move_highlight(self, index: int) -> None:
+        """Move the highlight to the given index, touching only the two options."""
+        if index == self.highlighted_index:
+            return
+        self.options[self.highlighted_index].is_highlighted = False
+        self.options[index].is_highlighted = True
+        self.highlighted_index = index
+
     def action_cursor_down(self) -> None:
         """Move the highlight down."""
-        self.highlighted_index = min(self.highlighted_index + 1, len(self.options) - 1)
-        self.update_highlight()
+        self._move_highlight(min(self.highlighted_index + 1, len(self.options) - 1))
 
     def action_cursor_up(self) -> None:
         """Move the highlight up."""
-        self.highlighted_index = max(self.highlighted_index - 1, 0)
-        self.update_highlight()
+        self._move_highlight(max(self.highlighted_index - 1, 0))
 
     class OptionSelected(Message):
         """Option selected message."""
@@ -211,7 +234,7 @@ class MenuList(Static, can_focus=True):
 
 class ScreenWelcome(Screen):
     def compose(self) -> ComposeResult:
-        yield Container(Label(ASCII_LOGO), classes="logo")
+        yield Container(Label(ASCII_LOGO_TEXT), classes="logo")
         yield Container(
             MenuList(
                 ("Index", "Pick a collection from all known collections"),
@@ -1,6 +1,23 @@
 def main():
     import argparse
 
+    class _VersionAction(argparse.Action):
+        """Print the installed version, looked up only when `--version` is passed."""
+
+        def __init__(self, option_strings, dest=argparse.SUPPRESS, **kwargs):
+            super().__init__(
+                option_strings, dest, nargs=0, default=argparse.SUPPRESS, **kwargs
+            )
+
+        def __call__(self, parser, namespace, values, option_string=None):
+            from importlib.metadata import PackageNotFoundError, version
+
+            try:
+                installed = version("bamboost-tui")
+            except PackageNotFoundError:
+                installed = "unknown"
+            parser.exit(message=f"{parser.prog} {installed}\n")
+
     parser = argparse.ArgumentParser()
     parser.add_argument(
         "--color",
@@ -9,8 +26,16 @@ def main():
         default=True,
         help="Use full colors instead of terminal colors.",
     )
-    from .app import BamboostApp
+    parser.add_argument(
+        "--version",
+        action=_VersionAction,
+        help="show program's version number and exit",
+    )
 
+    # `--help` and `--version` exit during parsing, so they never pay for importing
+    # the app (textual, rich, bamboost)
     args = parser.parse_args()
 
+    from .app import BamboostApp
+
     BamboostApp(watch_css=True, ansi_color=args.color).run()
@@ -1,43 +1,13 @@
 from __future__ import annotations
 
-import asyncio
-import time
-
 from textual import work
 from textual.app import App
 from textual.binding import Binding
-from textual.css.query import NoMatches
-from textual.theme import BUILTIN_THEMES, Theme
 from textual.widgets import HelpPanel
 
+from bamboost_tui._theme import ansi_theme
 from bamboost_tui.collection_table import ScreenCollection
 
-ansi_theme = Theme(
-    name="ansi",
-    primary="ansi_blue",
-    secondary="ansi_magenta",
-    accent="ansi_yellow",
-    foreground="ansi_bright_white",
-    background="ansi_default",
-    success="ansi_bright_green",
-    warning=BUILTIN_THEMES["textual-dark"].warning,
-    error="ansi_red",
-    surface="ansi_black",
-    panel="ansi_bright_black",
-    boost="ansi_bright_green",
-    dark=True,
-    variables={
-        "foreground-muted": "ansi_white",
-        "input-cursor-background": "ansi_black",
-        "input-cursor-foreground": "ansi_white",
-        "block-cursor-background": "ansi_black",
-        "block-cursor-foreground": "ansi_white",
-        "border": "ansi_bright_black",
-        "border-focus": "ansi_blue",
-        "footer-background": "ansi_black",
-    },
-)
-
 
 class BamboostApp(App):
     CSS_PATH = "bamboost.tcss"
@@ -52,41 +22,55 @@ class BamboostApp(App):
     BINDING_GROUP_TITLE = "App commands"
 
     def on_mount(self) -> None:
-        if ansi_colors_set := self.ansi_color:
-            self.register_theme(ansi_theme)
-            self.theme = "ansi"
-            self.ansi_color = ansi_colors_set
-        else:
-            self.theme = "gruvbox"
+        # switching the theme resets `ansi_color`, restore it within the same update
+        with self.batch_update():
+            if ansi_colors_set := self.ansi_color:
+                self.register_theme(ansi_theme)
+                self.theme = "ansi"
+                self.ansi_color = ansi_colors_set
+            else:
+                self.theme = "gruvbox"
 
         # This fixes the bug that the screen is empty after resuming the app
         self.app_resume_signal.subscribe(self, lambda *_args, **_kwargs: self.refresh())
 
-        self._preload_modules()
+        # schedule the first screen before warming the scientific stack in the
+        # background, so that the first frame does not wait for the imports
         self.push_screen(ScreenCollection())
+        self._preload_modules()
 
     @work(thread=True)
     async def _preload_modules(self) -> None:
         # Import in a thread to avoid blocking the event loop
+        from concurrent.futures import ThreadPoolExecutor
+        from importlib import import_module
+
+        # the independent extension packages load in parallel; bamboost (which
+        # imports both) follows serially to stay clear of cross-thread import cycles
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(import_module, ("h5py", "pandas")))
+
         import bamboost.core.hdf5.attrsdict
         import bamboost.core.hdf5.file
         import bamboost.core.simulation
         import bamboost.index
-        import h5py
-        import pandas
 
     async def action_toggle_help_panel(self):
-        try:
-            await self.query_one(HelpPanel).remove()
-        except NoMatches:
+        # the panel is mounted directly on the screen, no need to walk the whole DOM
+        help_panels = self.screen.query_children(HelpPanel)
+        if help_panels:
+            await help_panels.remove()
+        else:
             self.action_show_help_panel()
 
     def action_pop_screen_or_exit(self) -> None:
-        self.pop_screen()
-
-        # if only the default screen is left, exit the app
-        if len(self.screen_stack) <= 1 and self.screen_stack[0].id == "_default":
+        # if only the default screen would be left, exit without popping first
+        stack = self.screen_stack
+        if len(stack) <= 2 and stack[0].id == "_default":
             self.exit()
+            return
+
+        self.pop_screen()
 
 
 if __name__ == "__main__":
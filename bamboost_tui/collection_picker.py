@@ -59,25 +59,26 @@ class CollectionHit(Hit):
 
     def _render(self, matcher: Matcher | None = None) -> VisualType:
         coll = self.collection
-        path_style = self._picker.app.screen.get_component_rich_style(
-            "collection-list--path", partial=True
-        )
+        picker = self._picker
+        uid_text, path_text, count_text = picker._templates[coll.uid]
 
+        # the columns collect the cells of their table, so they are built per hit
         tab = Table.grid(
-            *(Column(width=w) for w in self._picker._widths),
+            *(Column(width=w) for w in picker._widths),
             padding=(0, 2),
             expand=True,
             pad_edge=False,
         )
-        styles = self._picker.styles
         tab.add_row(
-            Text(coll.uid, styles["uid"]),
-            Text.from_markup(matcher.highlight(coll.path).markup, style=path_style)
+            uid_text,
+            Text.from_markup(
+                matcher.highlight(coll.path).markup, style=picker.styles["path"]
+            )
             if matcher
-            else Text(coll.path, styles["path"]),
-            Text(str(coll.simulations.__len__()), styles["count"]),
+            else path_text,
+            count_text,
         )
-        return Group(tab, Text("last modified: ", styles["help"]))
+        return Group(tab, picker._help_text)
 
 
 class Picker(Provider):
@@ -92,6 +93,12 @@ class Picker(Provider):
         )
         super().__init__(screen, match_style)
         self.styles: dict[str, RichStyle] = {}
+        self._counts: dict[str, int] = {}
+        """The number of simulations per collection uid."""
+        self._templates: dict[str, tuple[Text, Text, Text]] = {}
+        """The prebuilt uid, path and count cells per collection uid."""
+        self._haystacks: list[tuple[CollectionORM, str, str]] = []
+        """The collections with their search string, as is and lowercased."""
 
     async def startup(self) -> None:
         from bamboost.index import Index
@@ -110,20 +117,40 @@ class Picker(Provider):
             "command-palette--help-text", partial=True
         )
         self.collections = Index.default.all_collections
-        widths = (0, 0, 0)
-        for coll in self.collections:
-            widths = tuple(
-                max(width, len(str(cell)))
-                for width, cell in zip(
-                    widths, (coll.uid, coll.path, coll.simulations.__len__())
-                )
+        # count the simulations once, each access to the relationship may load it
+        self._counts = {coll.uid: len(coll.simulations) for coll in self.collections}
+        collections = self.collections
+        self._widths = (
+            max((len(coll.uid) for coll in collections), default=0),
+            max((len(coll.path) for coll in collections), default=0),
+            max((len(str(count)) for count in self._counts.values()), default=0),
+        )
+
+        # the cells that do not depend on the search query are shared by all hits
+        styles = self.styles
+        self._templates = {
+            coll.uid: (
+                Text(coll.uid, styles["uid"]),
+                Text(coll.path, styles["path"]),
+                Text(str(self._counts[coll.uid]), styles["count"]),
             )
-        self._widths = widths
+            for coll in self.collections
+        }
+        self._help_text = Text("last modified: ", styles["help"])
+        self._haystacks = []
+        for coll in self.collections:
+            haystack = coll.uid + coll.path
+            self._haystacks.append((coll, haystack, haystack.lower()))
 
     async def search(self, query: str) -> Hits:
         matcher = self.matcher(query)
-        for coll in self.collections:
-            score = matcher.match(coll.uid + coll.path)
+        characters = set(query.lower())
+        for coll, haystack, haystack_lower in self._haystacks:
+            # a fuzzy match needs every character of the query, skip the scoring
+            # for collections which miss any of them
+            if not all(char in haystack_lower for char in characters):
+                continue
+            score = matcher.match(haystack)
             if score > 0:
                 yield CollectionHit(score, coll, self, matcher)
 
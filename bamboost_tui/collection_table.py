@@ -2,14 +2,16 @@ from __future__ import annotations
 
 import subprocess
 from datetime import datetime
+from functools import lru_cache
 from itertools import chain, cycle
 from textwrap import dedent
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from rich.highlighter import ReprHighlighter
 from rich.table import Table
 from rich.text import Text
 from textual import on, work
+from textual._two_way_dict import TwoWayDict
 from textual.binding import Binding
 from textual.color import Color
 from textual.containers import Center, Container, Horizontal, Right
@@ -19,12 +21,13 @@ from textual.reactive import reactive, var
 from textual.screen import Screen
 from textual.widget import Widget
 from textual.widgets import DataTable, Footer, LoadingIndicator, Static, Tab
-from textual.widgets.data_table import ColumnKey
+from textual.widgets.data_table import ColumnKey, RowKey
+from textual.worker import get_current_worker
 from typing_extensions import Self
 
 from bamboost_tui.collection_picker import CollectionHit, CollectionPicker
 from bamboost_tui.commandline import CommandLine, CommandMessage
-from bamboost_tui.utils import KeySubgroupsMixin, get_index
+from bamboost_tui.utils import KeySubgroupsMixin, get_index, worker_index
 from bamboost_tui.widgets import ModifiedDataTable, SortOrder
 from bamboost_tui.widgets.confirmation import ModalPrompt
 
@@ -46,12 +49,21 @@ class Header(Widget, can_focus=False):
     }
 
     def __init__(self, uid: str | None = None, path: str | None = None) -> None:
+        self._paths: dict[str, str] = {}
+        """The found paths of the collections shown in this header, by uid."""
         uid = uid or ""
         self.uid = uid
         self.path = self._get_path(uid)
+        self._rendered: tuple[tuple, Table] | None = None
+        """The last rendered table, with the uid, path and theme it was built for."""
         super().__init__(id="collection-header")
 
     def render(self) -> RenderResult:
+        # the header is repainted with its screen, rebuild only if its content changed
+        key = (self.uid, self.path, self.app.theme)
+        if self._rendered is not None and self._rendered[0] == key:
+            return self._rendered[1]
+
         tab = Table.grid("key", "value", padding=(0, 3))
         if self.uid:
             tab.add_row(
@@ -64,11 +76,26 @@ class Header(Widget, can_focus=False):
                 self.path or "[collection not found]",
                 style=self.get_component_rich_style("--path", partial=True),
             )
+        self._rendered = (key, tab)
         return tab
 
     def _get_path(self, uid: str | None) -> str:
-        found_path = get_index()._get_collection_path(uid) if uid else None
-        return found_path.as_posix() if found_path else "[Collection location found]"
+        if not uid:
+            return "[Collection location found]"
+        if uid in self._paths:
+            return self._paths[uid]
+        found_path = get_index()._get_collection_path(uid)
+        if not found_path:
+            return "[Collection location found]"
+        # switching back to a tab doesn't ask the index again
+        path = self._paths[uid] = found_path.as_posix()
+        return path
+
+    def forget_path(self, uid: str) -> None:
+        """Drop the remembered path of a collection, it is resolved again when
+        the collection is opened the next time.
+        """
+        self._paths.pop(uid, None)
 
     def on_mount(self):
         self.watch(self.screen, "current_uid", self._watch_current_uid, init=False)
@@ -108,8 +135,14 @@ class OpenCollectionsTabs(Widget):
         self.watch(self.screen, "current_uid", self._watch_current_uid, init=False)
 
     def _watch_current_uid(self, _old, _new: str | None) -> None:
-        self.tabs = set(self.screen._open_collections.keys())
-        self.refresh(recompose=True)
+        # only mount and remove the tabs of opened and closed collections
+        open_uids = self.screen._open_collections.keys()
+        for uid in self.tabs - open_uids:
+            self.query(f"Tab#tab-{uid}").remove()
+        added = [uid for uid in open_uids if uid not in self.tabs]
+        if added:
+            self.mount_all(Tab(uid, id=f"tab-{uid}") for uid in added)
+        self.tabs = set(open_uids)
         self.call_after_refresh(self.set_active, _new)
 
     def set_active(self, new: str | None) -> None:
@@ -170,19 +203,22 @@ class TableContainer(Container):
 
 
 REPR_HIGHLIGHTER = ReprHighlighter()
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
 def cell_highlighter(cell: object) -> Text:
     if isinstance(cell, datetime):
-        cell = cell.strftime("%Y-%m-%d %H:%M:%S")
+        cell = cell.strftime(DATETIME_FORMAT)
 
-    highlighted = REPR_HIGHLIGHTER(
-        Text(
-            str(cell),
-            justify="right" if str(cell).isdecimal() else "left",
-        )
+    return _highlight_cell(str(cell))
+
+
+@lru_cache(maxsize=8192)
+def _highlight_cell(value: str) -> Text:
+    """Highlight a cell's string once, values repeat a lot across the rows."""
+    return REPR_HIGHLIGHTER(
+        Text(value, justify="right" if value.isdecimal() else "left")
     )
-    return highlighted
 
 
 class CollectionTable(ModifiedDataTable, KeySubgroupsMixin, inherit_bindings=False):
@@ -241,13 +277,29 @@ class CollectionTable(ModifiedDataTable, KeySubgroupsMixin, inherit_bindings=Fal
             self._load_data()
         self.focus()
 
-    @work(exclusive=True)
-    async def _load_data(self):
+    @work(exclusive=True, thread=True)
+    def _load_data(self):
         import pandas as pd
 
-        sims = get_index().collection(self.uid).simulations
-        tab = [i.as_dict(standalone=False) for i in sims]
-        self.df = pd.DataFrame.from_records(tab)
+        # query and build the DataFrame in a thread to keep the interface responsive,
+        # with the worker's own index session since the default one is not thread-safe
+        with worker_index() as index:
+            sims = index.collection(self.uid).simulations
+            tab = [i.as_dict(standalone=False) for i in sims]
+        df = pd.DataFrame.from_records(tab)
+        # format datetime columns in one go instead of per cell in the highlighter,
+        # missing timestamps become empty cells
+        for column in df.select_dtypes(include=["datetime", "datetimetz"]).columns:
+            formatted = df[column].dt.strftime(DATETIME_FORMAT)
+            df[column] = formatted.astype(object).where(formatted.notna(), None)
+        # integers keep their values in the smallest fitting dtype
+        for column in df.select_dtypes(include="integer").columns:
+            df[column] = pd.to_numeric(df[column], downcast="integer")
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._set_data, df)
+
+    def _set_data(self, df: pd.DataFrame) -> None:
+        self.df = df
         """The DataFrame that holds the data for the table."""
         self.loading = False
         self.focus()
@@ -262,18 +314,25 @@ class CollectionTable(ModifiedDataTable, KeySubgroupsMixin, inherit_bindings=Fal
     async def _create_table(self) -> Self:
         # clear the current table
         self.clear(True)
+        self.fixed_columns = 1
 
         # build columns and rows from dataframe
-        for col in self.df.columns:
-            self.add_column(str(col), key=str(col))
+        df = self.df
         try:
-            names = self.df["name"]
+            names = df["name"].tolist()
         except KeyError:
-            names = self.df.index
-        for row, name in zip(self.df.values, names):
-            self.add_row(*row, key=str(name))
+            names = df.index.tolist()
+
+        # zip the column lists instead of iterating `df.values`, which first upcasts
+        # the whole frame into an object array
+        columns = [df[col].tolist() for col in df.columns]
+
+        # coalesce the updates of the individual insertions into a single repaint
+        with self.app.batch_update():
+            for col in df.columns:
+                self.add_column(str(col), key=str(col))
+            self.add_rows_bulk(zip(*columns), map(str, names))
 
-        self.fixed_columns = 1
         return self
 
     def watch_cursor_coordinate(
@@ -290,13 +349,23 @@ class CollectionTable(ModifiedDataTable, KeySubgroupsMixin, inherit_bindings=Fal
                 old_region_h.translate(-Offset(self.scroll_offset.x, 0)),
                 new_region_h.translate(-Offset(self.scroll_offset.x, 0)),
             )
-            self._header_cell_render_cache.clear()
+            # only the headers of the two columns change their highlighting
+            column_keys = {
+                self._column_locations.get_key(old_coordinate.column),
+                self._column_locations.get_key(new_coordinate.column),
+            }
+            header_cache = self._header_cell_render_cache
+            # the LRUCache is not iterable, take a snapshot of its keys to discard from
+            for cache_key in list(header_cache.keys()):
+                if cache_key[1] in column_keys:
+                    header_cache.discard(cache_key)
         else:
             # Refresh entire row highlighting
             old = Region(old_region.x, old_region.y, self.size.width, old_region.height)
-            self._refresh_region(old)
             new = Region(new_region.x, new_region.y, self.size.width, new_region.height)
-            self._refresh_region(new)
+            self.refresh(
+                old.translate(-self.scroll_offset), new.translate(-self.scroll_offset)
+            )
 
         # TODO: This may be remmoved
         super().watch_cursor_coordinate(old_coordinate, new_coordinate)
@@ -323,10 +392,44 @@ class CollectionTable(ModifiedDataTable, KeySubgroupsMixin, inherit_bindings=Fal
         else:
             sort_order = SortOrder(not reverse)
 
-        self.sort(key, reverse=sort_order.value)
+        self._sort_rows(key, reverse=sort_order.value)
         self._sort_column = key
         self._sort_column_order = sort_order
 
+    def _sort_rows(self, key: ColumnKey, reverse: bool) -> None:
+        """Sort the rows by a column, using the typed column of the DataFrame.
+
+        Falls back to the sort of the DataTable if the column cannot be sorted by
+        pandas.
+        """
+        df = self.df
+        try:
+            values = cast("pd.Series", df[key.value])
+            order = values.sort_values(ascending=not reverse, kind="stable").index
+        except (KeyError, TypeError, ValueError):
+            # e.g. columns of array parameters, which pandas cannot compare
+            try:
+                self.sort(key, reverse=reverse)
+            except (TypeError, ValueError):
+                # neither can python for numpy arrays, compare them as displayed
+                self.sort(key, key=str, reverse=reverse)
+            return
+
+        names = df["name"] if "name" in df.columns else df.index.to_series()
+        row_locations = self._row_locations
+        # deleted simulations are still in the DataFrame, but no longer in the table
+        row_keys = [RowKey(str(name)) for name in names.loc[order].tolist()]
+        self._row_locations = TwoWayDict(
+            {
+                row_key: new_index
+                for new_index, row_key in enumerate(
+                    [row_key for row_key in row_keys if row_key in row_locations]
+                )
+            }
+        )
+        self._update_count += 1
+        self.refresh()
+
     def action_select_cursor(self):
         name = self._row_locations.get_key(self.cursor_row).value
         assert name is not None, "No simulation selected."
@@ -468,6 +571,7 @@ class ScreenCollection(Screen, inherit_bindings=False):
         if _open_collections:
             collection = _open_collections.pop(uid)
             self.remove_children(f"#{collection.id}")
+            self.query_one(Header).forget_path(uid)
             if not _open_collections:
                 self.current_uid = None
                 self._table_container._active_widget = Placeholder()
@@ -1,10 +1,8 @@
 from __future__ import annotations
 
 import argparse
-import re
 from argparse import Namespace
-from dataclasses import field
-from functools import partial
+from functools import cached_property, lru_cache, partial
 from itertools import chain
 from typing import (
     TYPE_CHECKING,
@@ -12,6 +10,7 @@ from typing import (
     Callable,
     Generic,
     Iterable,
+    Literal,
     Type,
     TypeVar,
     Union,
@@ -34,12 +33,33 @@ if TYPE_CHECKING:
     from bamboost_tui.collection_table import CollectionTable
 
     ChoicesType = Union[Iterable[str], Callable[["CommandLine"], Iterable[str]], None]
-    ChoicesResolvedType = Iterable[str]
+    ChoicesResolvedType = tuple[str, ...]
 
 T = TypeVar("T")
 
 
+@lru_cache(maxsize=4096)
+def _dropdown_item(
+    main: str,
+    option_type: Literal["function", "variable", "object"],
+    right_meta: str,
+) -> DropdownItem:
+    """Return a shared dropdown item. The autocomplete never mutates its items, so
+    identical items are reused across keystrokes and command line instances.
+    """
+    return DropdownItem(main, option_type, right_meta)
+
+
 class Argument(Generic[T]):
+    __slots__ = (
+        "_choice_set",
+        "_choices",
+        "_resolved_choices",
+        "_value",
+        "argparse_args",
+        "name",
+    )
+
     def __init__(
         self,
         name: str,
@@ -54,10 +74,11 @@ class Argument(Generic[T]):
     def _resolve(self, command_line: CommandLine) -> Self:
         choices = self._choices
         if callable(choices):
-            self._resolved_choices = choices(command_line)
-        else:
-            self._resolved_choices = choices or []
+            choices = choices(command_line)
 
+        # store plain python containers, e.g. instead of a pandas Index of columns
+        self._resolved_choices = tuple(choices) if choices is not None else ()
+        self._choice_set = frozenset(self._resolved_choices)
         return self
 
     @property
@@ -67,6 +88,9 @@ class Argument(Generic[T]):
         except AttributeError:
             raise ValueError("Choices have not been resolved yet.")
 
+    def is_valid_choice(self, value: str) -> bool:
+        return value in self._choice_set
+
     @overload
     def __get__(self, instance: None, owner: type) -> Self: ...
     @overload
@@ -85,8 +109,10 @@ class Argument(Generic[T]):
 
 
 class Option(Argument[T]):
-    bool_flag: bool = False
-    aliases: list[str] = field(default_factory=list)
+    __slots__ = ("aliases", "bool_flag")
+
+    bool_flag: bool
+    aliases: list[str]
 
     def __init__(
         self,
@@ -146,72 +172,95 @@ class Parser:
         self._commands: dict[str, CommandMessage] = {
             cmd.__name__.lower(): cmd(target) for cmd in commands
         }
-        self._argparse_parser = self._create_argparse_parser(self._commands.values())
         self._prefix = prefix
 
+        # the command set is fixed for a parser, so the dropdown items are built once
+        self._main_command_list = [
+            _dropdown_item(cmd, "function", "func") for cmd in self._commands
+        ]
+        self._choice_items: dict[Argument, list[DropdownItem]] = {}
+        self._last_completed: str | None = None
+        self._last_candidates: list[DropdownItem] = []
+
     def candidates(self, state: TargetState) -> list[DropdownItem]:
         text = self._prefix + " " + state.text
-        main_command_list = [
-            DropdownItem(cmd, "function", "func") for cmd in self._commands.keys()
-        ]
-        if not text:
-            return main_command_list
 
-        if text.endswith(" "):
-            tokens = text.split()
-        else:
-            tokens = text.split()[:-1]
+        # the candidates only depend on the completed words, so they are reused while
+        # the last word is being typed (and on focus changes)
+        completed = text[: text.rfind(" ") + 1]
+        if completed == self._last_completed:
+            return self._last_candidates
+
+        candidates = self._main_command_list
+        if (res := self._get_current_options(completed.split())) is not None:
+            candidates = res
 
-        if (res := self._get_current_options(tokens)) is not None:
-            return res
-        else:
-            return main_command_list
+        self._last_completed = completed
+        self._last_candidates = candidates
+        return candidates
 
     def _get_current_options(self, tokens: list[str]) -> list[DropdownItem] | None:
         if not tokens:
             return None
 
         command_token, last_token = tokens[0], tokens[-1]
-        if command_token not in self._commands:
+        command = self._commands.get(command_token)
+        if command is None:
             return []
 
-        command = self._commands[command_token]
+        # bind the lookups used in the loops below to locals
+        item = _dropdown_item
+        command_options = command._options
         consumed_options = set()  # the options that have been consumed before
+        add_consumed = consumed_options.add
         arg_count = 0  # number of arguments consumed
-        options: list[DropdownItem] = []
 
         for token in tokens[1:]:
-            if token.startswith("-"):
-                consumed_options.add(token)
+            if token[:1] == "-":
+                add_consumed(token)
             else:
                 arg_count += 1
 
-        if last_token.startswith("-") and (
-            choices := getattr(command._options.get(last_token), "choices", None)
-        ):
-            return [DropdownItem(opt, "variable", "choice") for opt in choices]
+        if last_token[:1] == "-":
+            last_option = command_options.get(last_token)
+            if last_option is not None and last_option.choices:
+                return [item(opt, "variable", "choice") for opt in last_option.choices]
 
-        options.extend(
-            {
-                DropdownItem(c, "variable", "option")
-                for c in (command._options.keys() - consumed_options)
-            }
-        )
+        # iterate the options dict to keep the declaration order stable
+        options = [
+            item(c, "variable", "option")
+            for c in command_options
+            if c not in consumed_options
+        ]
 
-        try:
-            current_arg = command._arguments[arg_count]
-            if current_arg.choices is not None:
-                options.extend(
-                    [
-                        DropdownItem(choice, "object", "column")
-                        for choice in current_arg.choices
-                    ]
-                )
-        except IndexError:
-            pass
+        arguments = command._arguments
+        if arg_count < len(arguments):
+            options.extend(self._get_choice_items(arguments[arg_count]))
 
         return options
 
+    def _get_choice_items(self, argument: Argument) -> list[DropdownItem]:
+        """Return the dropdown items for the choices of an argument.
+
+        The choices are resolved once when the parser is built (e.g. the columns of the
+        collection's dataframe), so the items are cached for the lifetime of the parser.
+        """
+        try:
+            return self._choice_items[argument]
+        except KeyError:
+            items = [
+                _dropdown_item(choice, "object", "column")
+                for choice in argument.choices
+            ]
+            self._choice_items[argument] = items
+            return items
+
+    @cached_property
+    def _argparse_parser(self) -> argparse.ArgumentParser:
+        """The argparse parser, built on first use since most commands are handled by
+        `_parse_simple`."""
+        return self._create_argparse_parser(self._commands.values())
+
     def _create_argparse_parser(
         self, commands: Iterable[CommandMessage]
     ) -> argparse.ArgumentParser:
@@ -241,11 +290,47 @@ class Parser:
         return parser
 
     def parse(self, text: str) -> CommandMessage:
-        text = self._prefix + " " + text
-        parser = self._argparse_parser
-        args = parser.parse_args(text.split())
+        tokens = (self._prefix + " " + text).split()
+        args = self._parse_simple(tokens)
+        if args is None:
+            args = self._argparse_parser.parse_args(tokens)
         return self._commands[args.command].set_parsed_values(args)
 
+    def _parse_simple(self, tokens: list[str]) -> Namespace | None:
+        """Parse commands made of positional arguments and boolean flags without
+        going through argparse.
+
+        Returns None if the tokens are not handled here (e.g. invalid input or options
+        taking values), in which case argparse parses them and reports errors.
+        """
+        if not tokens or (command := self._commands.get(tokens[0])) is None:
+            return None
+
+        values: dict[str, Any] = {}
+        for flag, opt in command._options.items():
+            if opt.argparse_args:
+                return None
+            values[flag.lstrip("-")] = False if opt.bool_flag else None
+
+        positionals: list[str] = []
+        for token in tokens[1:]:
+            if token.startswith("-"):
+                opt = command._options.get(token)
+                if opt is None or not opt.bool_flag:
+                    return None
+                values[token.lstrip("-")] = True
+            else:
+                positionals.append(token)
+
+        if len(positionals) != len(command._arguments):
+            return None
+        for arg, value in zip(command._arguments, positionals):
+            if arg.argparse_args or not arg.is_valid_choice(value):
+                return None
+            values[arg.name] = value
+
+        return Namespace(command=tokens[0], **values)
+
 
 class CommandLine(Screen):
     BINDINGS = [
@@ -346,17 +431,8 @@ def _complete(input_widget: Input, text: str, state: TargetState) -> None:
     """The function that will be called when a completion is selected. It will replace
     the last word with the selected completion.
     """
-    WHITESPACE_BEFORE = re.compile(r"(?<=\s)\S")
-
     # delete the last word to the last whitespace
-    try:
-        *_, hit = re.finditer(
-            WHITESPACE_BEFORE, input_widget.value[: input_widget.cursor_position]
-        )
-    except ValueError:
-        target = 0
-    else:
-        target = hit.start()
+    target = input_widget.value.rfind(" ", 0, input_widget.cursor_position) + 1
 
     if not input_widget.value.endswith(" "):
         input_widget.delete(target, input_widget.cursor_position)
@@ -368,6 +444,4 @@ def _complete(input_widget: Input, text: str, state: TargetState) -> None:
 def _search_string(state: TargetState) -> str:
     """Function that extracts the search string from the current state."""
     text = state.text
-    if not text or text.endswith(" "):
-        return ""
-    return text.split()[-1]
+    return text[text.rfind(" ") + 1 :]
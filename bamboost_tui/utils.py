@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import MutableMapping
+import re
+from contextlib import contextmanager
+from functools import cache
+from threading import Lock
+from typing import TYPE_CHECKING, Iterator, MutableMapping
 
 from textual import events
 from textual.app import App
@@ -8,6 +12,9 @@ from textual.binding import Binding, BindingType
 from textual.color import Color
 from textual.widget import Widget
 
+if TYPE_CHECKING:
+    from bamboost.index import Index
+
 
 def get_index():
     from bamboost.index import Index
@@ -15,7 +22,31 @@ def get_index():
     return Index.default
 
 
+_worker_index: Index | None = None
+_WORKER_INDEX_LOCK = Lock()
+
+
+@contextmanager
+def worker_index() -> Iterator[Index]:
+    """Yield an index to query from worker threads.
+
+    The default index shares a single session across its queries, which is not
+    thread-safe and stays on the event loop. Workers use a separate index on the
+    same database with its own session, one worker at a time.
+    """
+    global _worker_index
+
+    with _WORKER_INDEX_LOCK:
+        if _worker_index is None:
+            from bamboost.index import Index
+
+            # same database file and search paths as `Index.default`
+            _worker_index = Index()
+        yield _worker_index
+
+
 Subgroup = MutableMapping[str, "Binding  | Subgroup"]  # recursive
+_ACTION_WITH_ARGS = re.compile(r"(\w+)\((.*)\)")
 
 
 class KeySubgroupsMixin:
@@ -63,9 +94,7 @@ class KeySubgroupsMixin:
             event.stop()
             self._active_subgroup = None
             # split action into method and args "do_something(arg1, arg2)"
-            import re
-
-            match = re.match(r"(\w+)\((.*)\)", item.action)
+            match = _ACTION_WITH_ARGS.match(item.action)
             if match:
                 method, args = match.groups()
                 getattr(self, f"action_{method}")(args)
@@ -90,5 +119,10 @@ class KeySubgroupsMixin:
 
 
 def variable_to_color(app: App, variable: str) -> str:
-    val = app.theme_variables.get(variable)
-    return Color.parse(val).rich_color.name
+    return _color_name(app.theme_variables.get(variable))
+
+
+@cache
+def _color_name(value: str | None) -> str:
+    """Parse a theme color once; the set of values is bounded by the themes."""
+    return Color.parse(value).rich_color.name  # pyright: ignore[reportArgumentType]
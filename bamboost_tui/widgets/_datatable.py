@@ -10,42 +10,57 @@ This implementation changes the following:
 from __future__ import annotations
 
 from enum import Enum
+from functools import cached_property, lru_cache
 from itertools import zip_longest
-from typing import Callable, Literal, cast
+from typing import Callable, Iterable, Literal, cast
 
 from rich.console import RenderableType
 from rich.padding import Padding
 from rich.segment import Segment
 from rich.style import Style
 from rich.text import Text
+from textual import events
 from textual._types import SegmentLines
+from textual.cache import LRUCache
 from textual.color import Color
 from textual.coordinate import Coordinate
 from textual.renderables.styled import Styled
 from textual.widgets._data_table import (
     _EMPTY_TEXT,
     CellCacheKey,
+    CellType,
     ColumnKey,
     CursorType,
     DataTable,
+    DuplicateKey,
+    Row,
     RowKey,
     RowRenderables,
     default_cell_formatter,
 )
 
+_SORT_SYMBOLS = {False: "", True: ""}
+"""The header indicator of the sort order, keyed by `SortOrder.value`."""
+_FIXED_META = Style.from_meta({"fixed": True})
+"""Meta style marking cells of fixed columns, shared by all rendered rows."""
+
+
+@lru_cache(maxsize=4096)
+def _cell_meta(row_index: int, column_index: int) -> Style:
+    """The meta style locating a cell, reused when the cell is rendered again."""
+    return Style.from_meta({"row": row_index, "column": column_index})
+
 
 class SortOrder(Enum):
     ASC = False
     DESC = True
 
-    __symbols__ = {ASC: "", DESC: ""}
-
     def __not__(self) -> SortOrder:
         return SortOrder(not self.value)
 
-    @property
+    @cached_property
     def symbol(self) -> str:
-        return self.__symbols__[self.value]
+        return _SORT_SYMBOLS[self.value]
 
 
 class ModifiedDataTable(DataTable):
@@ -70,7 +85,10 @@ class ModifiedDataTable(DataTable):
         disabled: bool = False,
     ):
         self.highlighter = cell_highlighter or None
-        self._header_cell_render_cache = {}
+        # bounded like the row and cell render caches of the DataTable
+        self._header_cell_render_cache = LRUCache[CellCacheKey, SegmentLines](1000)
+        self._pad_segment_cache: dict[tuple, list[Segment]] = {}
+        self._row_renderables_cache = LRUCache[tuple, RowRenderables](1000)
         self._sort_column: ColumnKey | None = None
         self._sort_column_order = SortOrder.DESC
 
@@ -92,6 +110,71 @@ class ModifiedDataTable(DataTable):
             disabled=disabled,
         )
 
+    def _clear_caches(self) -> None:
+        super()._clear_caches()
+        self._row_renderables_cache.clear()
+
+    def _on_resize(self, _: events.Resize) -> None:
+        # the padding widths depend on the widget width
+        self._pad_segment_cache.clear()
+
+    def add_rows_bulk(
+        self, rows: Iterable[Iterable[CellType]], keys: Iterable[str]
+    ) -> list[RowKey]:
+        """Add a number of keyed rows at the bottom of the DataTable.
+
+        Equivalent to calling `add_row` with a key for every row, but the column order,
+        the cursor and the idle check are only handled once for all rows.
+
+        Args:
+            rows: Iterable of rows. A row is an iterable of cells.
+            keys: The keys of the rows, in the same order.
+
+        Returns:
+            A list of the keys for the rows that were added.
+        """
+        column_keys = [column.key for column in self.ordered_columns]
+        row_locations = self._row_locations
+        data = self._data
+        row_data = self.rows
+        new_rows = self._new_rows
+        was_empty = not row_data
+
+        # validate all rows before inserting any, so a bad row leaves the table as it was
+        pending = [(RowKey(key), tuple(cells)) for key, cells in zip(keys, rows)]
+        seen: set[RowKey] = set()
+        for row_key, cells in pending:
+            if row_key in row_locations or row_key in seen:
+                raise DuplicateKey(f"The row key {row_key!r} already exists.")
+            if len(cells) > len(column_keys):
+                raise ValueError("More values provided than there are columns.")
+            seen.add(row_key)
+
+        row_keys: list[RowKey] = []
+        for row_index, (row_key, cells) in enumerate(pending, start=self.row_count):
+            row_locations[row_key] = row_index
+            data[row_key] = dict(zip_longest(column_keys, cells))
+            row_data[row_key] = Row(row_key, 1, None, False)
+            new_rows.add(row_key)
+            row_keys.append(row_key)
+
+        if not row_keys:
+            return row_keys
+
+        self._require_update_dimensions = True
+        self.cursor_coordinate = self.cursor_coordinate
+        if (
+            was_empty
+            and column_keys
+            and self.show_cursor
+            and self.cursor_type != "none"
+        ):
+            self._highlight_cursor()
+
+        self._update_count += 1
+        self.check_idle()
+        return row_keys
+
     def _render_line_in_row(
         self,
         row_key: RowKey,
@@ -136,6 +219,9 @@ class ModifiedDataTable(DataTable):
         should_highlight = self._should_highlight
         render_cell = self._render_cell
         header_style = self.get_component_styles("datatable--header").rich_style
+        fixed_columns = self.fixed_columns
+        label_width = self._row_label_column_width
+        widths = [column.get_render_width(self) for column in self.ordered_columns]
 
         if row_key in self._row_locations:
             row_index = cast(int, self._row_locations.get(row_key))
@@ -152,27 +238,25 @@ class ModifiedDataTable(DataTable):
                 row_index,
                 -1,
                 header_style,
-                width=self._row_label_column_width,
+                width=label_width,
                 cursor=should_highlight(cursor_location, cell_location, "row"),
                 hover=should_highlight(hover_location, cell_location, cursor_type),
             )[line_no]
             fixed_row.append(label_cell_lines)
 
-        if self.fixed_columns:
+        if fixed_columns:
             if row_key is self._header_row_key:
                 fixed_style = header_style  # We use the header style either way.
             else:
                 fixed_style = self.get_component_styles("datatable--fixed").rich_style
-                fixed_style += Style.from_meta({"fixed": True})
-            for column_index, column in enumerate(
-                self.ordered_columns[: self.fixed_columns]
-            ):
+                fixed_style += _FIXED_META
+            for column_index, width in enumerate(widths[:fixed_columns]):
                 cell_location = Coordinate(row_index, column_index)
                 fixed_cell_lines = render_cell(
                     row_index,
                     column_index,
                     fixed_style,
-                    column.get_render_width(self),
+                    width,
                     cursor=should_highlight(cursor_location, cell_location, "row"),
                     hover=should_highlight(hover_location, cell_location, cursor_type),
                 )[line_no]
@@ -181,13 +265,13 @@ class ModifiedDataTable(DataTable):
         row_style = self._get_row_style(row_index, base_style)
 
         scrollable_row = []
-        for column_index, column in enumerate(self.ordered_columns):
+        for column_index, width in enumerate(widths):
             cell_location = Coordinate(row_index, column_index)
             cell_lines = render_cell(
                 row_index,
                 column_index,
                 row_style,
-                column.get_render_width(self),
+                width,
                 cursor=should_highlight(cursor_location, cell_location, cursor_type),
                 hover=should_highlight(hover_location, cell_location, cursor_type),
             )[line_no]
@@ -195,26 +279,31 @@ class ModifiedDataTable(DataTable):
 
         # Extending the styling out horizontally to fill the container
         widget_width = self.size.width
-        table_width = (
-            sum(
-                column.get_render_width(self)
-                for column in self.ordered_columns[self.fixed_columns :]
-            )
-            + self._row_label_column_width
-        )
+        table_width = sum(widths[fixed_columns:]) + label_width
         remaining_space = max(0, widget_width - table_width)
         background_color = self.background_colors[1]
-        if row_style.bgcolor is not None:
-            # TODO: This should really be in a component class
-            faded_color = Color.from_rich_color(row_style.bgcolor).blend(
-                background_color, factor=0.25
-            )
-            faded_style = Style.from_color(
-                color=row_style.color, bgcolor=faded_color.rich_color
-            )
-        else:
-            faded_style = Style.from_color(row_style.color, row_style.bgcolor)
-        scrollable_row.append([Segment(" " * remaining_space, faded_style)])
+        pad_key = (
+            remaining_space,
+            row_style.color,
+            row_style.bgcolor,
+            background_color,
+        )
+        try:
+            pad_line = self._pad_segment_cache[pad_key]
+        except KeyError:
+            if row_style.bgcolor is not None:
+                # TODO: This should really be in a component class
+                faded_color = Color.from_rich_color(row_style.bgcolor).blend(
+                    background_color, factor=0.25
+                )
+                faded_style = Style.from_color(
+                    color=row_style.color, bgcolor=faded_color.rich_color
+                )
+            else:
+                faded_style = Style.from_color(row_style.color, row_style.bgcolor)
+            pad_line = [Segment(" " * remaining_space, faded_style)]
+            self._pad_segment_cache[pad_key] = pad_line
+        scrollable_row.append(pad_line)
 
         row_pair = (fixed_row, scrollable_row)
         self._row_render_cache[cache_key] = row_pair
@@ -238,7 +327,6 @@ class ModifiedDataTable(DataTable):
             # This is the cell where header and row labels intersect
             return RowRenderables(None, header_row)
 
-        ordered_row = self.get_row_at(row_index)
         row_key = self._row_locations.get_key(row_index)
         if row_key is None:
             return RowRenderables(None, [])
@@ -246,19 +334,37 @@ class ModifiedDataTable(DataTable):
         if row_metadata is None:
             return RowRenderables(None, [])
 
-        formatted_row_cells: list[RenderableType] = [
-            (
-                _EMPTY_TEXT
-                if datum is None
-                else default_cell_formatter(
-                    self.highlighter(datum) if self.highlighter else datum,
-                    wrap=row_metadata.height != 1,
-                    height=row_metadata.height,
-                )
-                or _EMPTY_TEXT
-            )
-            for datum, _ in zip_longest(ordered_row, range(len(self.columns)))
-        ]
+        # every cell of a row asks for the whole row, so highlight it only once
+        cache_key = (
+            row_key,
+            row_metadata.height,
+            self._should_render_row_labels,
+            self._update_count,
+        )
+        if cache_key in self._row_renderables_cache:
+            return self._row_renderables_cache[cache_key]
+
+        ordered_row = self.get_row_at(row_index)
+
+        # pad short rows with empty cells up to the number of columns
+        missing = len(self.columns) - len(ordered_row)
+        if missing > 0:
+            ordered_row = [*ordered_row, *[None] * missing]
+
+        highlighter = self.highlighter
+        wrap = row_metadata.height != 1
+        height = row_metadata.height
+        formatted_row_cells: list[RenderableType] = []
+        for datum in ordered_row:
+            if datum is None:
+                formatted_row_cells.append(_EMPTY_TEXT)
+                continue
+            if highlighter:
+                datum = highlighter(datum)
+            # the formatter returns renderables (e.g. highlighted text) unchanged
+            if not isinstance(datum, Text):
+                datum = default_cell_formatter(datum, wrap=wrap, height=height)
+            formatted_row_cells.append(datum or _EMPTY_TEXT)
 
         label = None
         if self._should_render_row_labels:
@@ -271,7 +377,9 @@ class ModifiedDataTable(DataTable):
                 if row_metadata.label
                 else None
             )
-        return RowRenderables(label, formatted_row_cells)
+        row_renderables = RowRenderables(label, formatted_row_cells)
+        self._row_renderables_cache[cache_key] = row_renderables
+        return row_renderables
 
     def _render_cell(
         self,
@@ -328,7 +436,7 @@ class ModifiedDataTable(DataTable):
         if cell_cache_key in self._cell_render_cache and not is_header_cell:
             return self._cell_render_cache[cell_cache_key]
 
-        base_style += Style.from_meta({"row": row_index, "column": column_index})
+        base_style += _cell_meta(row_index, column_index)
         row_label, row_cells = self._get_row_renderables(row_index)
 
         if is_row_label_cell:
@@ -372,6 +480,18 @@ class ModifiedDataTable(DataTable):
                 row_height = row.height
                 options = self.app.console.options.update_dimensions(width, row_height)
 
+        # Blank cells (empty values, row labels off the cursor row) render to plain
+        # background, so skip the console pipeline for them.
+        if (
+            not is_header_cell
+            and row_height > 0
+            and (cell is _EMPTY_TEXT or (isinstance(cell, str) and not cell.strip()))
+        ):
+            blank = Segment(" " * width, base_style + component_style + post_style)
+            lines = [[blank] for _ in range(row_height)]
+            self._cell_render_cache[cell_cache_key] = lines
+            return lines
+
         # If the row height is explicitly set to 1, then we don't wrap.
         if row_height == 1:
             options = options.update(no_wrap=True)